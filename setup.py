@@ -88,6 +88,7 @@ setup(
         "isodate",
         "markdown>=3.0",
         "msgpack>=1.0.0, <1.1",
+        "orjson>=3.5.0, <4",
         "pandas>=1.2.2, <1.3",
         "parsedatetime",
         "pathlib2",
@@ -22,7 +22,7 @@ from typing import Any, Dict, List, NamedTuple, Optional, Union
 from flask_babel import gettext as _
 from pandas import DataFrame
 
-from superset import app, db
+from superset import app, db, is_feature_enabled
 from superset.connectors.base.models import BaseDatasource
 from superset.connectors.connector_registry import ConnectorRegistry
 from superset.exceptions import QueryObjectValidationError
@@ -38,7 +38,7 @@ from superset.utils.core import (
     json_int_dttm_ser,
 )
 from superset.utils.date_parser import get_since_until, parse_human_timedelta
-from superset.utils.hashing import md5_sha_from_dict
+from superset.utils.hashing import blake2b_sha_from_dict, md5_sha_from_dict
 from superset.views.utils import get_time_range_endpoints
 
 config = app.config
@@ -64,11 +64,31 @@ DEPRECATED_EXTRAS_FIELDS = (
     DeprecatedField(old_name="druid_time_origin", new_name="druid_time_origin"),
 )
 
+# annotation layer fields that affect the payload, and hence the cache key
+ANNOTATION_FIELDS = frozenset(
+    {
+        "annotationType",
+        "descriptionColumns",
+        "intervalEndColumn",
+        "name",
+        "overrides",
+        "sourceType",
+        "timeColumn",
+        "titleColumn",
+        "value",
+    }
+)
+
 
 class QueryObject:
     """
     The query object's schema matches the interfaces of DB connectors like sqla
     and druid. The query objects are constructed on the client.
+
+    Query objects are treated as immutable after construction, as `to_dict()`,
+    `metric_names` and the annotation layers of `cache_key()` are memoized. To
+    derive a modified query object, mutate a `copy.copy()` of it, which starts out
+    with empty caches.
     """
 
     annotation_layers: List[Dict[str, Any]]
@@ -126,6 +146,10 @@ class QueryObject:
         extras = extras or {}
         annotation_layers = annotation_layers or []
 
+        self._dict_cache: Optional[Dict[str, Any]] = None
+        self._metric_names_cache: Optional[List[str]] = None
+        self._annotation_cache: Optional[List[Dict[str, Any]]] = None
+
         self.is_rowcount = is_rowcount
         self.datasource = None
         if datasource:
@@ -193,50 +217,62 @@ class QueryObject:
         self.groupby = groupby or []
         self.orderby = orderby or []
 
-        # rename deprecated fields
-        for field in DEPRECATED_FIELDS:
-            if field.old_name in kwargs:
-                logger.warning(
-                    "The field `%s` is deprecated, please use `%s` instead.",
-                    field.old_name,
-                    field.new_name,
-                )
-                value = kwargs[field.old_name]
-                if value:
-                    if hasattr(self, field.new_name):
-                        logger.warning(
-                            "The field `%s` is already populated, "
-                            "replacing value with contents from `%s`.",
-                            field.new_name,
-                            field.old_name,
-                        )
-                    setattr(self, field.new_name, value)
-
-        # move deprecated extras fields to extras
-        for field in DEPRECATED_EXTRAS_FIELDS:
-            if field.old_name in kwargs:
-                logger.warning(
-                    "The field `%s` is deprecated and should "
-                    "be passed to `extras` via the `%s` property.",
-                    field.old_name,
-                    field.new_name,
-                )
-                value = kwargs[field.old_name]
-                if value:
-                    if hasattr(self.extras, field.new_name):
-                        logger.warning(
-                            "The field `%s` is already populated in "
-                            "`extras`, replacing value with contents "
-                            "from `%s`.",
-                            field.new_name,
-                            field.old_name,
-                        )
-                    self.extras[field.new_name] = value
+        # deprecated fields can only be passed as extra keyword arguments
+        if kwargs:
+            # rename deprecated fields
+            for field in DEPRECATED_FIELDS:
+                if field.old_name in kwargs:
+                    logger.warning(
+                        "The field `%s` is deprecated, please use `%s` instead.",
+                        field.old_name,
+                        field.new_name,
+                    )
+                    value = kwargs[field.old_name]
+                    if value:
+                        if hasattr(self, field.new_name):
+                            logger.warning(
+                                "The field `%s` is already populated, "
+                                "replacing value with contents from `%s`.",
+                                field.new_name,
+                                field.old_name,
+                            )
+                        setattr(self, field.new_name, value)
+
+            # move deprecated extras fields to extras
+            for field in DEPRECATED_EXTRAS_FIELDS:
+                if field.old_name in kwargs:
+                    logger.warning(
+                        "The field `%s` is deprecated and should "
+                        "be passed to `extras` via the `%s` property.",
+                        field.old_name,
+                        field.new_name,
+                    )
+                    value = kwargs[field.old_name]
+                    if value:
+                        if hasattr(self.extras, field.new_name):
+                            logger.warning(
+                                "The field `%s` is already populated in "
+                                "`extras`, replacing value with contents "
+                                "from `%s`.",
+                                field.new_name,
+                                field.old_name,
+                            )
+                        self.extras[field.new_name] = value
+
+    def __copy__(self) -> "QueryObject":
+        query_object = self.__class__.__new__(self.__class__)
+        query_object.__dict__.update(self.__dict__)
+        query_object._dict_cache = None
+        query_object._metric_names_cache = None
+        query_object._annotation_cache = None
+        return query_object
 
     @property
     def metric_names(self) -> List[str]:
         """Return metrics names (labels), coerce adhoc metrics to strings."""
-        return get_metric_names(self.metrics or [])
+        if self._metric_names_cache is None:
+            self._metric_names_cache = get_metric_names(self.metrics or [])
+        return self._metric_names_cache
 
     @property
     def column_names(self) -> List[str]:
@@ -250,8 +286,8 @@ class QueryObject:
         """Validate query object"""
         error: Optional[QueryObjectValidationError] = None
         all_labels = self.metric_names + self.column_names
-        if len(set(all_labels)) < len(all_labels):
-            dup_labels = find_duplicates(all_labels)
+        dup_labels = find_duplicates(all_labels)
+        if dup_labels:
             error = QueryObjectValidationError(
                 _(
                     "Duplicate column/metric labels: %(labels)s. Please make "
@@ -264,6 +300,12 @@ class QueryObject:
         return error
 
     def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the query object as a dict. The dict is built once and shared between
+        calls, hence callers must not mutate it.
+        """
+        if self._dict_cache is not None:
+            return self._dict_cache
         query_object_dict = {
             "apply_fetch_values_predicate": self.apply_fetch_values_predicate,
             "granularity": self.granularity,
@@ -283,6 +325,7 @@ class QueryObject:
             "columns": self.columns,
             "orderby": self.orderby,
         }
+        self._dict_cache = query_object_dict
         return query_object_dict
 
     def cache_key(self, **extra: Any) -> str:
@@ -293,14 +336,19 @@ class QueryObject:
         the use-provided inputs to bounds, which may be time-relative (as in
         "5 days ago" or "now").
         """
-        cache_dict = self.to_dict()
+        # datetime bounds are hard values, hence left out of the key
+        cache_dict = {
+            key: value
+            for key, value in self.to_dict().items()
+            if key not in ("from_dttm", "to_dttm")
+        }
         cache_dict.update(extra)
 
         # TODO: the below KVs can all be cleaned up and moved to `to_dict()` at some
         #  predetermined point in time when orgs are aware that the previously
         #  chached results will be invalidated.
         if not self.apply_fetch_values_predicate:
-            del cache_dict["apply_fetch_values_predicate"]
+            cache_dict.pop("apply_fetch_values_predicate", None)
         if self.datasource:
             cache_dict["datasource"] = self.datasource.uid
         if self.result_type:
@@ -310,29 +358,20 @@ class QueryObject:
         if self.post_processing:
             cache_dict["post_processing"] = self.post_processing
 
-        for k in ["from_dttm", "to_dttm"]:
-            del cache_dict[k]
-
-        annotation_fields = [
-            "annotationType",
-            "descriptionColumns",
-            "intervalEndColumn",
-            "name",
-            "overrides",
-            "sourceType",
-            "timeColumn",
-            "titleColumn",
-            "value",
-        ]
-        annotation_layers = [
-            {field: layer[field] for field in annotation_fields if field in layer}
-            for layer in self.annotation_layers
-        ]
+        if self._annotation_cache is None:
+            self._annotation_cache = [
+                {field: layer[field] for field in ANNOTATION_FIELDS & layer.keys()}
+                for layer in self.annotation_layers
+            ]
         # only add to key if there are annotations present that affect the payload
-        if annotation_layers:
-            cache_dict["annotation_layers"] = annotation_layers
+        if self._annotation_cache:
+            cache_dict["annotation_layers"] = self._annotation_cache
 
-        return md5_sha_from_dict(cache_dict, default=json_int_dttm_ser, ignore_nan=True)
+        if is_feature_enabled("LEGACY_CACHE_KEYS"):
+            return md5_sha_from_dict(
+                cache_dict, default=json_int_dttm_ser, ignore_nan=True
+            )
+        return blake2b_sha_from_dict(cache_dict, default=json_int_dttm_ser)
 
     def exec_post_processing(self, df: DataFrame) -> DataFrame:
         """
@@ -382,6 +382,10 @@ DEFAULT_FEATURE_FLAGS: Dict[str, bool] = {
     # for report with type 'report' still send with email and slack message with
     # screenshot and link
     "ALERTS_ATTACH_REPORTS": True,
+    # Compute chart data cache keys with the legacy simplejson/MD5 scheme instead of
+    # orjson/BLAKE2b. Enable this during an upgrade to keep serving entries that were
+    # cached by a previous version; disabling it invalidates them.
+    "LEGACY_CACHE_KEYS": False,
 }
 
 # Feature flags may also be set via 'SUPERSET_FEATURE_' prefixed environment vars.
@@ -502,6 +506,12 @@ CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "null"}
 # Cache for datasource metadata and query results
 DATA_CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "null"}
 
+# Timeout (in seconds) of an opt-in per-process cache kept in front of the cache
+# backend for datasource metadata (schema, table and view lists). A forced refresh
+# or a cleared backend only reaches the process serving it, so with several workers
+# the others can keep serving stale values for up to this long. 0 disables it.
+MEMOIZED_FUNC_LOCAL_CACHE_TIMEOUT = 0
+
 # store cache keys by datasource UID (via CacheKey) for custom processing/invalidation
 STORE_CACHE_KEYS_IN_METADATA_DB = False
 
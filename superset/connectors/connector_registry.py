@@ -48,15 +48,16 @@ class ConnectorRegistry:
     ) -> "BaseDatasource":
         """Safely get a datasource instance, raises `DatasetNotFoundError` if
         `datasource_type` is not registered or `datasource_id` does not
-        exist."""
+        exist.
+
+        The lookup goes through the session's identity map, hence a datasource that
+        was already loaded in the session (e.g. by the `QueryContext` of the
+        `QueryObject`s built in the same request) is returned without querying the
+        metadata database again."""
         if datasource_type not in cls.sources:
             raise DatasetNotFoundError()
 
-        datasource = (
-            session.query(cls.sources[datasource_type])
-            .filter_by(id=datasource_id)
-            .one_or_none()
-        )
+        datasource = session.query(cls.sources[datasource_type]).get(datasource_id)
 
         if not datasource:
             raise DatasetNotFoundError()
@@ -49,7 +49,9 @@ class BaseDAO:
     @classmethod
     def find_by_id(cls, model_id: int, session: Session = None) -> Model:
         """
-        Find a model by id, if defined applies `base_filter`
+        Find a model by id, if defined applies `base_filter`. Without a
+        `base_filter`, models already loaded in the session are returned without
+        querying the database
         """
         session = session or db.session
         query = session.query(cls.model_cls)
@@ -58,7 +60,8 @@ class BaseDAO:
             query = cls.base_filter(  # pylint: disable=not-callable
                 "id", data_model
             ).apply(query, None)
-        return query.filter_by(id=model_id).one_or_none()
+            return query.filter_by(id=model_id).one_or_none()
+        return query.get(model_id)
 
     @classmethod
     def find_by_ids(cls, model_ids: List[int]) -> List[Model]:
@@ -109,6 +112,26 @@ class BaseDAO:
             raise DAOCreateFailedError(exception=ex)
         return model
 
+    @classmethod
+    def bulk_create(
+        cls, properties_list: List[Dict[str, Any]], commit: bool = True
+    ) -> None:
+        """
+        Generic for creating models in bulk. Rows are inserted with a single
+        executemany statement, bypassing the ORM unit of work, hence relationships
+        are not handled and the created models are not returned
+        :raises: DAOCreateFailedError
+        """
+        if cls.model_cls is None:
+            raise DAOConfigError()
+        try:
+            db.session.bulk_insert_mappings(cls.model_cls, properties_list)
+            if commit:
+                db.session.commit()
+        except SQLAlchemyError as ex:  # pragma: no cover
+            db.session.rollback()
+            raise DAOCreateFailedError(exception=ex)
+
     @classmethod
     def update(
         cls, model: Model, properties: Dict[str, Any], commit: bool = True
@@ -128,6 +151,25 @@ class BaseDAO:
             raise DAOUpdateFailedError(exception=ex)
         return model
 
+    @classmethod
+    def bulk_update(
+        cls, properties_list: List[Dict[str, Any]], commit: bool = True
+    ) -> None:
+        """
+        Generic for updating models in bulk. Each dict must contain the primary key
+        of the model to update, relationships are not handled
+        :raises: DAOUpdateFailedError
+        """
+        if cls.model_cls is None:
+            raise DAOConfigError()
+        try:
+            db.session.bulk_update_mappings(cls.model_cls, properties_list)
+            if commit:
+                db.session.commit()
+        except SQLAlchemyError as ex:  # pragma: no cover
+            db.session.rollback()
+            raise DAOUpdateFailedError(exception=ex)
+
     @classmethod
     def delete(cls, model: Model, commit: bool = True) -> Model:
         """
@@ -142,3 +184,22 @@ class BaseDAO:
             db.session.rollback()
             raise DAODeleteFailedError(exception=ex)
         return model
+
+    @classmethod
+    def bulk_delete(cls, models: Optional[List[Model]], commit: bool = True) -> None:
+        """
+        Generic for deleting models in bulk with a single DELETE statement
+        :raises: DAODeleteFailedError
+        """
+        if cls.model_cls is None:
+            raise DAOConfigError()
+        item_ids = [model.id for model in models] if models else []
+        try:
+            db.session.query(cls.model_cls).filter(
+                cls.model_cls.id.in_(item_ids)
+            ).delete(synchronize_session="fetch")
+            if commit:
+                db.session.commit()
+        except SQLAlchemyError as ex:  # pragma: no cover
+            db.session.rollback()
+            raise DAODeleteFailedError(exception=ex)
@@ -19,16 +19,18 @@ from datetime import datetime, timedelta
 from functools import wraps
 from typing import Any, Callable, Dict, Optional, Union
 
+from cachelib import SimpleCache
 from flask import current_app as app, request
 from flask_caching import Cache
+from flask_caching.backends.nullcache import NullCache
 from werkzeug.wrappers.etag import ETagResponseMixin
 
-from superset import db
+from superset import db, is_feature_enabled
 from superset.extensions import cache_manager
 from superset.models.cache import CacheKey
 from superset.stats_logger import BaseStatsLogger
 from superset.utils.core import json_int_dttm_ser
-from superset.utils.hashing import md5_sha_from_dict
+from superset.utils.hashing import blake2b_sha_from_dict, md5_sha_from_dict
 
 config = app.config  # type: ignore
 stats_logger: BaseStatsLogger = config["STATS_LOGGER"]
@@ -36,7 +38,10 @@ logger = logging.getLogger(__name__)
 
 
 def generate_cache_key(values_dict: Dict[str, Any], key_prefix: str = "") -> str:
-    hash_str = md5_sha_from_dict(values_dict, default=json_int_dttm_ser)
+    if is_feature_enabled("LEGACY_CACHE_KEYS"):
+        hash_str = md5_sha_from_dict(values_dict, default=json_int_dttm_ser)
+    else:
+        hash_str = blake2b_sha_from_dict(values_dict, default=json_int_dttm_ser)
     return f"{key_prefix}{hash_str}"
 
 
@@ -47,6 +52,9 @@ def set_and_log_cache(
     cache_timeout: Optional[int] = None,
     datasource_uid: Optional[str] = None,
 ) -> None:
+    if isinstance(cache_instance.cache, NullCache):
+        return
+
     timeout = cache_timeout if cache_timeout else config["CACHE_DEFAULT_TIMEOUT"]
     try:
         dttm = datetime.utcnow().isoformat().split(".")[0]
@@ -95,22 +103,44 @@ def memoized_func(
     timeout of cache is set to 600 seconds by default,
     except cache_timeout = {timeout in seconds} is passed to the decorated function.
 
+    If MEMOIZED_FUNC_LOCAL_CACHE_TIMEOUT is set, values are also kept in a
+    per-process cache for up to that many seconds, sparing a round-trip to the cache
+    backend on repeated calls, unless the backend is a null cache. Forced refreshes
+    in other processes aren't seen until the local entry expires.
+
     :param key: a callable function that takes function arguments and returns
                 the caching key.
     :param cache: a FlaskCache instance that will store the cache.
     """
 
     def wrap(f: Callable[..., Any]) -> Callable[..., Any]:
+        local_cache = SimpleCache(threshold=1024)
+
+        @wraps(f)
         def wrapped_f(self: Any, *args: Any, **kwargs: Any) -> Any:
             if not kwargs.get("cache", True):
                 return f(self, *args, **kwargs)
 
             cache_key = key(self, *args, **kwargs)
-            obj = cache.get(cache_key)
-            if not kwargs.get("force") and obj is not None:
-                return obj
+            local_timeout = config["MEMOIZED_FUNC_LOCAL_CACHE_TIMEOUT"]
+            if kwargs.get("cache_timeout"):
+                local_timeout = min(local_timeout, kwargs["cache_timeout"])
+            if local_timeout and isinstance(cache.cache, NullCache):
+                local_timeout = 0
+            # a forced refresh doesn't need the cached value, skip the lookup
+            if not kwargs.get("force"):
+                obj = local_cache.get(cache_key) if local_timeout else None
+                if obj is not None:
+                    return obj
+                obj = cache.get(cache_key)
+                if obj is not None:
+                    if local_timeout:
+                        local_cache.set(cache_key, obj, timeout=local_timeout)
+                    return obj
             obj = f(self, *args, **kwargs)
             cache.set(cache_key, obj, timeout=kwargs.get("cache_timeout"))
+            if local_timeout:
+                local_cache.set(cache_key, obj, timeout=local_timeout)
             return obj
 
         return wrapped_f
@@ -114,11 +114,13 @@ def parse_human_timedelta(
     >>> parse_human_timedelta('1 day') == timedelta(days=1)
     True
     """
+    if not human_readable:
+        return timedelta()
     cal = parsedatetime.Calendar()
     source_dttm = dttm_from_timetuple(
         source_time.timetuple() if source_time else datetime.now().timetuple()
     )
-    modified_dttm = dttm_from_timetuple(cal.parse(human_readable or "", source_dttm)[0])
+    modified_dttm = dttm_from_timetuple(cal.parse(human_readable, source_dttm)[0])
     return modified_dttm - source_dttm
 
 
@@ -15,8 +15,9 @@
 # specific language governing permissions and limitations
 # under the License.
 import hashlib
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 
+import orjson
 import simplejson as json
 
 
@@ -32,3 +33,57 @@ def md5_sha_from_dict(
     json_data = json.dumps(obj, sort_keys=True, ignore_nan=ignore_nan, default=default)
 
     return md5_sha_from_str(json_data)
+
+
+def blake2b_sha_from_dict(
+    obj: Dict[Any, Any], default: Optional[Callable[[Any], Any]] = None,
+) -> str:
+    """
+    Return a 128-bit BLAKE2b digest of a canonical (key-sorted) orjson
+    serialization of `obj`. NaN values are serialized as `null`, sets are serialized
+    as sorted lists, and other objects orjson can't serialize natively are passed
+    through `default`. Payloads orjson rejects outright without calling `default`
+    (e.g. integers outside the 64-bit range) fall back to the canonical simplejson
+    serialization.
+
+    :raises TypeError: If `obj` contains a value that can't be serialized
+    """
+    default_errors: List[TypeError] = []
+
+    def canonical_default(value: Any) -> Any:
+        if isinstance(value, (set, frozenset)):
+            try:
+                return sorted(value)
+            except TypeError:
+                return list(value)
+        try:
+            if default is None:
+                raise TypeError(
+                    f"Object of type {type(value).__name__} is not JSON serializable"
+                )
+            return default(value)
+        except TypeError as ex:
+            default_errors.append(ex)
+            raise
+
+    try:
+        json_data = orjson.dumps(
+            obj,
+            default=canonical_default,
+            option=orjson.OPT_SORT_KEYS
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_SERIALIZE_NUMPY,
+        )
+    except TypeError:
+        # unserializable values are reported as is rather than serialized again
+        if default_errors:
+            raise default_errors[0]
+        json_data = json.dumps(
+            obj,
+            sort_keys=True,
+            ignore_nan=True,
+            use_decimal=False,
+            default=canonical_default,
+        ).encode("utf-8")
+
+    return hashlib.blake2b(json_data, digest_size=16).hexdigest()
@@ -0,0 +1,56 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# isort:skip_file
+import tests.test_app  # pylint: disable=unused-import
+from superset import db
+from superset.dao.base import BaseDAO
+from superset.models.core import CssTemplate
+from tests.base_tests import SupersetTestCase
+
+
+class CssTemplateBaseDAO(BaseDAO):
+    model_cls = CssTemplate
+
+
+class TestBaseDAO(SupersetTestCase):
+    def test_bulk_create_update_delete(self):
+        """
+        Base DAO: Test the generic bulk create, update and delete
+        """
+        CssTemplateBaseDAO.bulk_create(
+            [
+                {"template_name": f"bulk_template{cx}", "css": f"css{cx}"}
+                for cx in range(3)
+            ]
+        )
+        query = db.session.query(CssTemplate).filter(
+            CssTemplate.template_name.like("bulk_template%")
+        )
+        css_templates = query.all()
+        assert len(css_templates) == 3
+
+        CssTemplateBaseDAO.bulk_update(
+            [
+                {"id": css_template.id, "css": "updated"}
+                for css_template in css_templates
+            ]
+        )
+        db.session.expire_all()
+        assert {css_template.css for css_template in query.all()} == {"updated"}
+
+        CssTemplateBaseDAO.bulk_delete(css_templates)
+        assert query.count() == 0
@@ -16,6 +16,8 @@
 # under the License.
 import json
 
+from sqlalchemy import column
+
 from superset.db_engine_specs.snowflake import SnowflakeEngineSpec
 from superset.models.core import Database
 from tests.db_engine_specs.base_tests import TestDbEngineSpec
@@ -34,6 +36,16 @@ class TestSnowflakeDbEngineSpec(TestDbEngineSpec):
         for type_, expected in test_cases.items():
             self.assertEqual(SnowflakeEngineSpec.convert_dttm(type_, dttm), expected)
 
+    def test_time_exp_5_minute_grain(self):
+        col = column("ts")
+        expr = SnowflakeEngineSpec.get_timestamp_expr(col, None, "PT5M")
+        result = str(expr.compile(None))
+        self.assertEqual(
+            result,
+            "DATEADD(MINUTE, FLOOR(DATE_PART(MINUTE, ts) / 5) * 5, "
+            "DATE_TRUNC('HOUR', ts))",
+        )
+
     def test_database_connection_test_mutator(self):
         database = Database(sqlalchemy_uri="snowflake://abc")
         SnowflakeEngineSpec.mutate_db_for_connection_test(database)
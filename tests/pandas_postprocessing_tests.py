@@ -17,9 +17,9 @@
 # isort:skip_file
 from datetime import datetime
 from importlib.util import find_spec
-import math
 from typing import Any, List, Optional
 
+import numpy as np
 from pandas import DataFrame, Series, Timestamp
 import pytest
 
@@ -55,12 +55,9 @@ def series_to_list(series: Series) -> List[Any]:
     :param series: Series to convert
     :return: list without nan or inf
     """
-    return [
-        None
-        if not isinstance(val, str) and (math.isnan(val) or math.isinf(val))
-        else val
-        for val in series.tolist()
-    ]
+    series = series.astype(object)
+    finite = series.notna() & ~series.isin([np.inf, -np.inf])
+    return series.where(finite, None).tolist()
 
 
 def round_floats(
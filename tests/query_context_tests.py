@@ -14,6 +14,7 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import copy
 import re
 from typing import Any, Dict
 
@@ -181,6 +182,27 @@ class TestQueryContext(SupersetTestCase):
         cache_key = query_context.query_cache_key(query_object)
         self.assertNotEqual(cache_key_original, cache_key)
 
+    def test_query_object_copy_resets_memoized_values(self):
+        """
+        Ensure that a copied query object doesn't reuse the memoized dict and metric
+        names of the original query object.
+        """
+        self.login(username="admin")
+        payload = get_query_context("birth_names")
+        query_context = ChartDataQueryContextSchema().load(payload)
+        query_object = query_context.queries[0]
+        cache_key_original = query_context.query_cache_key(query_object)
+        assert query_context.query_cache_key(query_object) == cache_key_original
+
+        assert query_object.metric_names
+        query_object_copy = copy.copy(query_object)
+        query_object_copy.row_limit = query_object.row_limit + 1
+        query_object_copy.metrics = []
+        assert query_object_copy.to_dict()["row_limit"] == query_object.row_limit + 1
+        assert query_object_copy.metric_names == []
+        assert query_context.query_cache_key(query_object_copy) != cache_key_original
+        assert query_context.query_cache_key(query_object) == cache_key_original
+
     def test_query_context_time_range_endpoints(self):
         """
         Ensure that time_range_endpoints are populated automatically when missing
@@ -0,0 +1,104 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from unittest.mock import Mock, patch
+
+from cachelib import SimpleCache
+from flask_caching import Cache
+from flask_caching.backends.nullcache import NullCache
+
+from superset.utils.cache import memoized_func, set_and_log_cache
+from tests.base_tests import SupersetTestCase
+
+
+class UtilsCacheTests(SupersetTestCase):
+    def _memoize(self, backend):
+        cache = Mock()
+        cache.cache = backend
+        cache.get.side_effect = backend.get
+        cache.set.side_effect = lambda key, value, timeout=None: backend.set(
+            key, value, timeout=timeout
+        )
+        func = Mock(side_effect=lambda obj, value, **kwargs: [value])
+
+        @memoized_func(key=lambda obj, value, **kwargs: f"key:{value}", cache=cache)
+        def memoized(obj, value, **kwargs):
+            """Return the value wrapped in a list."""
+            return func(obj, value, **kwargs)
+
+        return memoized, func, cache
+
+    def test_memoized_func(self):
+        memoized, func, cache = self._memoize(SimpleCache())
+        self.assertEqual(memoized.__name__, "memoized")
+        self.assertEqual(memoized.__doc__, "Return the value wrapped in a list.")
+
+        self.assertEqual(memoized(None, 1), [1])
+        self.assertEqual(memoized(None, 1), [1])
+        func.assert_called_once()
+        self.assertEqual(cache.get.call_count, 2)
+
+        # a forced refresh skips the lookup and repopulates the backend
+        self.assertEqual(memoized(None, 1, force=True), [1])
+        self.assertEqual(func.call_count, 2)
+        self.assertEqual(cache.get.call_count, 2)
+        self.assertEqual(cache.set.call_count, 2)
+
+        # caching can be disabled per call
+        memoized(None, 1, cache=False)
+        self.assertEqual(func.call_count, 3)
+        self.assertEqual(cache.get.call_count, 2)
+
+    @patch.dict("superset.utils.cache.config", MEMOIZED_FUNC_LOCAL_CACHE_TIMEOUT=60)
+    def test_memoized_func_local_cache(self):
+        memoized, func, cache = self._memoize(SimpleCache())
+
+        memoized(None, 1)
+        memoized(None, 1)
+        func.assert_called_once()
+        # the second call is served by the local cache
+        cache.get.assert_called_once()
+
+        # a forced refresh bypasses both caches and repopulates them
+        memoized(None, 1, force=True)
+        self.assertEqual(func.call_count, 2)
+        cache.get.assert_called_once()
+        memoized(None, 1)
+        self.assertEqual(func.call_count, 2)
+        cache.get.assert_called_once()
+
+    @patch.dict("superset.utils.cache.config", MEMOIZED_FUNC_LOCAL_CACHE_TIMEOUT=60)
+    def test_memoized_func_local_cache_null_backend(self):
+        memoized, func, cache = self._memoize(NullCache())
+
+        memoized(None, 1)
+        memoized(None, 1)
+        # nothing is cached, not even locally
+        self.assertEqual(func.call_count, 2)
+        self.assertEqual(cache.get.call_count, 2)
+
+    @patch.dict("superset.utils.cache.config", STORE_CACHE_KEYS_IN_METADATA_DB=True)
+    @patch("superset.utils.cache.db")
+    def test_set_and_log_cache_null_backend(self, mock_db):
+        cache = Cache(
+            self.app, config={"CACHE_TYPE": "null", "CACHE_NO_NULL_WARNING": True}
+        )
+        self.assertIsInstance(cache.cache, NullCache)
+
+        with patch.object(cache, "set") as mock_set:
+            set_and_log_cache(cache, "key", {"data": 1}, datasource_uid="1__table")
+            mock_set.assert_not_called()
+        mock_db.session.add.assert_not_called()
@@ -254,6 +254,7 @@ class TestDateParser(SupersetTestCase):
         self.assertEqual(parse_human_timedelta("1 year"), timedelta(366))
         self.assertEqual(parse_human_timedelta("-1 year"), timedelta(-365))
         self.assertEqual(parse_human_timedelta(None), timedelta(0))
+        self.assertEqual(parse_human_timedelta(""), timedelta(0))
         self.assertEqual(
             parse_human_timedelta("1 month", datetime(2019, 4, 1)), timedelta(30),
         )
@@ -16,12 +16,17 @@
 # under the License.
 # pylint: disable=no-self-use
 import datetime
+import decimal
 import math
 from typing import Any
 
 import pytest
 
-from superset.utils.hashing import md5_sha_from_dict, md5_sha_from_str
+from superset.utils.hashing import (
+    blake2b_sha_from_dict,
+    md5_sha_from_dict,
+    md5_sha_from_str,
+)
 
 
 def test_basic_md5_sha():
@@ -95,3 +100,84 @@ def test_ignore_nan_md5_sha():
 
     assert md5_sha_from_str(serialized_obj) == md5_sha_from_dict(obj, ignore_nan=True)
     assert md5_sha_from_str(serialized_obj) == "40e87d61f6add03816bccdeac5713b9f"
+
+
+def test_sort_order_blake2b_sha():
+    obj_1 = {
+        "product": "Coffee",
+        "price_in_cents": 4000,
+        "company": "Gobias Industries",
+    }
+
+    obj_2 = {
+        "product": "Coffee",
+        "company": "Gobias Industries",
+        "price_in_cents": 4000,
+    }
+
+    assert blake2b_sha_from_dict(obj_1) == blake2b_sha_from_dict(obj_2)
+    assert blake2b_sha_from_dict(obj_1) == "b0b1acf9ea25990b8c360126be1037a2"
+
+
+def test_custom_default_blake2b_sha():
+    obj_1 = {
+        "product": "Coffee",
+        "company": "Gobias Industries",
+        "price": decimal.Decimal("40.5"),
+    }
+
+    obj_2 = {
+        "product": "Coffee",
+        "company": "Gobias Industries",
+        "price": 40.5,
+    }
+
+    assert blake2b_sha_from_dict(obj_1, default=float) == blake2b_sha_from_dict(obj_2)
+    with pytest.raises(TypeError, match="Object of type Decimal"):
+        blake2b_sha_from_dict(obj_1)
+    with pytest.raises(TypeError, match="Object of type Decimal"):
+        blake2b_sha_from_dict({**obj_1, "stock": 2 ** 70})
+
+
+def test_set_blake2b_sha():
+    obj_1 = {
+        "product": "Coffee",
+        "company": "Gobias Industries",
+        "tags": {"decaf", "arabica", "organic"},
+    }
+
+    obj_2 = {
+        "product": "Coffee",
+        "company": "Gobias Industries",
+        "tags": ["arabica", "decaf", "organic"],
+    }
+
+    assert blake2b_sha_from_dict(obj_1) == blake2b_sha_from_dict(obj_2)
+
+
+def test_nan_blake2b_sha():
+    obj_1 = {
+        "product": "Coffee",
+        "company": "Gobias Industries",
+        "price": math.nan,
+    }
+
+    obj_2 = {
+        "product": "Coffee",
+        "company": "Gobias Industries",
+        "price": None,
+    }
+
+    assert blake2b_sha_from_dict(obj_1) == blake2b_sha_from_dict(obj_2)
+    assert blake2b_sha_from_dict(obj_1) == "d9ea3e82d66fd41d8b685585902e022a"
+
+
+def test_big_int_blake2b_sha():
+    obj_1 = {"product": "Coffee", "price": 2 ** 70}
+    obj_2 = {"product": "Coffee", "price": 2 ** 70 + 1}
+
+    assert blake2b_sha_from_dict(obj_1) == blake2b_sha_from_dict(dict(obj_1))
+    assert blake2b_sha_from_dict(obj_1) != blake2b_sha_from_dict(obj_2)
+    assert blake2b_sha_from_dict({"price": 2 ** 70, "tags": {"b", "a"}}) == (
+        blake2b_sha_from_dict({"tags": ["a", "b"], "price": 2 ** 70})
+    )